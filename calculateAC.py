@@ -32,12 +32,42 @@ def calculateAC(totalWeight, RR, ac, numS, ppm = 10, alpha = 0.05):
         Column 6: monoMassInput        
     '''   
 
+    AC = ac[ac[:,4]==numS]
+    RR2= RR[ac[:,4]==numS]
+
+    return calculateACSubset(totalWeight, RR2, AC, numS, ppm, alpha)
+
+def calculateACSubset(totalWeight, RR2, AC, numS, ppm = 10, alpha = 0.05):
+    '''predict the atomic composition based on the monoisotopic mass, using reference tables
+    that only contain the atomic compositions with numS sulphur-atoms
+
+    Parameters
+    ----------
+
+    totalWeight: float
+        single monoisotopic mass
+    RR2: numpy.ndarray
+        relative isotope ratios of the atomic compositions in AC
+    AC: numpy.ndarray
+        atomic compositions with numS sulphur-atoms
+    numS: float
+        The number of sulphur-atoms the elemental composition should have
+    ppm: float
+        mass tolerance
+    alpha: float
+        significance level of the prediction intervals. Currenlty only 0.05 and 0.01 are allowed
+
+
+    Returns
+    -------
+
+    results: numpy.ndarray
+        Elemental compositions predicted based on the monoisotopic mass (see calculateAC)
+    '''
+
     weight = np.array([12, 1.0078250321, 14.0030740052, 15.9949146, 31.97207070])   # weight [C, H, N, O, S]
     tolerance = ppm * totalWeight / 10**6
 
-    AC = ac[ac[:,4]==numS]
-    RR2= RR[ac[:,4]==numS]
-   
     # calculate prediction interval for isoRatios
     estimateRR = calculateIsoRatio(numS, totalWeight, alpha)     # columns: fit, lwb, upb 
     
@@ -94,22 +124,23 @@ def calculateAC(totalWeight, RR, ac, numS, ppm = 10, alpha = 0.05):
             elif remainderH == 3:
                 minAC[1] =  minAC[1] - 2
 
-    rangeAC = np.array([                            
+    # the ranges have different lengths, so they are kept in a list instead of a (ragged) numpy array
+    rangeAC = [
         np.arange(0,maxAC[0]-minAC[0] + 1, 1),
         np.arange(0,maxAC[1]-minAC[1] + 1, 4),
         np.arange(0,maxAC[2]-minAC[2] + 1, 2),
         np.arange(0,maxAC[3]-minAC[3] + 1, 1),
-        np.arange(0,maxAC[4]-minAC[4] + 1, 1)])   
+        np.arange(0,maxAC[4]-minAC[4] + 1, 1)]
 
     ## STEP 3 ## Generating all combinations and mass based filter
 
-    mass = np.array([                           
+    mass = [
         list(x * weight[0] for x in rangeAC[0]),
         list(x * weight[1] for x in rangeAC[1]),
         list(x * weight[2] for x in rangeAC[2]),
         list(x * weight[3] for x in rangeAC[3]),
         list(x * weight[4] for x in rangeAC[4])
-    ])
+    ]
 
 
     nbComb = len(rangeAC[0])*len(rangeAC[1])*len(rangeAC[2])*len(rangeAC[3])*len(rangeAC[4])
@@ -0,0 +1,217 @@
+""" engine.py
+    This module implements the PacMass engine, a reentrant alternative to the module level state in main.py
+    The reference tables are loaded once, split per number of sulphur-atoms and never modified afterwards,
+    so a single engine can be shared between threads
+"""
+
+import numpy as np
+import pandas as pd
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.append("..")
+from pacMASS import preprocess
+from pacMASS import calculateAC
+from pacMASS.preprocess import PacMassInputError
+
+###############################################################################
+
+_DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
+
+def _readTable(filename):
+    table = pd.read_csv(os.path.join(_DATA_DIR, filename), sep="\t").values
+    table.flags.writeable = False
+    return table
+
+def _checkAlpha(alpha):
+    if alpha not in (0.05, 0.01):
+        raise PacMassInputError("alpha = {} cannot be used, only 0.05 and 0.01 are allowed".format(alpha))
+
+def _toNumSList(numSList):
+    if isinstance(numSList, int):
+        numSList = list(map(int, str(numSList)))
+    return numSList
+
+
+class PacMass:
+    '''engine predicting the elemental composition of peptides and small proteins based on the monoisotopic mass
+
+    All reference data is owned by the engine and read-only, so predict and predict_many can be called
+    concurrently from several threads. Invalid input raises a PacMassInputError instead of terminating the process.
+    predict_many runs on a thread pool that is shared by all calls; release it with close() or by using the
+    engine as a context manager. close() can be called at any time: calls that are running finish on the old
+    pool and the next call of predict_many creates a new one. Masses that no worker has started yet are predicted
+    by the calling thread itself, so predict_many also works from a task running on the pool it submits to
+    (e.g. the executor passed to the engine) instead of waiting for a worker that might never become free.
+
+    Parameters
+    ----------
+
+    ac: numpy.ndarray, optional
+        atomic composition table (columns C, H, N, O, S). Read from data/AC_matrix_2.txt if not given
+    RR: numpy.ndarray, optional
+        relative isotope ratios for every row of ac. Read from data/RelRatio_matrix.txt if not given
+    maxWorkers: int, optional
+        number of threads of the thread pool created by the engine
+    executor: concurrent.futures.Executor, optional
+        thread pool used by predict_many instead of creating one. It is not shut down by close()
+    '''
+
+    def __init__(self, ac=None, RR=None, maxWorkers=None, executor=None):
+        if ac is None:
+            ac = _readTable("AC_matrix_2.txt")
+        if RR is None:
+            RR = _readTable("RelRatio_matrix.txt")
+
+        if len(ac) != len(RR):
+            raise ValueError("The atomic composition and relative ratio tables should have the same number of rows")
+
+        self._maxWorkers = maxWorkers
+        self._executor = executor
+        self._ownsExecutor = executor is None
+        self._executorLock = threading.Lock()
+        self._subsets = {}
+
+        # precompute the reference tables for every number of sulphur-atoms
+        for numS in np.unique(ac[:,4]):
+            index = ac[:,4] == numS
+            AC = ac[index]
+            RR2 = RR[index]
+            AC.flags.writeable = False
+            RR2.flags.writeable = False
+            self._subsets[int(numS)] = (AC, RR2)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        '''shut down the thread pool created by the engine, it is created again when predict_many is called'''
+
+        if not self._ownsExecutor:
+            return
+
+        with self._executorLock:
+            executor, self._executor = self._executor, None
+
+        # work that is already submitted still finishes before the pool is shut down
+        if executor is not None:
+            executor.shutdown()
+
+    def _submit(self, monoMass, numSList, ppm, alpha):
+        # submitting while holding the lock makes sure close() cannot shut the pool down in between
+        with self._executorLock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self._maxWorkers)
+
+            return [self._executor.submit(self._predictMass, n, numSList, ppm, alpha) for n in monoMass]
+
+    def _predictMass(self, monoMass, numSList, ppm, alpha):
+        results = []
+
+        for nS in numSList:
+            if nS not in self._subsets:
+                continue
+
+            AC, RR2 = self._subsets[nS]
+            result = calculateAC.calculateACSubset(monoMass, RR2, AC, nS, ppm, alpha)
+
+            if result.size != 0:
+                results.append(result)
+
+        return results
+
+    def predict(self, monoMass, numSList, ppm=10, alpha=0.05):
+        '''predict the elemental compositions of a single neutral monoisotopic mass
+
+        Parameters
+        ----------
+
+        monoMass: float
+            A single neutral monoisotopic mass
+        numSList: list
+            The number of sulphur-atoms
+        ppm: float
+            mass tolerance
+        alpha: float
+            significance level of the prediction intervals. Currently only 0.05 and 0.01 are allowed
+
+
+        Returns
+        -------
+
+        results: list of numpy.ndarray's
+            Elemental compositions predicted with pacMASS, one array per number of sulphur-atoms with at least
+            one candidate (see pacmass for the columns)
+
+        Raises
+        ------
+
+        PacMassInputError
+            If the mass is not a single number within the allowed mass boundaries or alpha is not allowed
+        '''
+
+        _checkAlpha(alpha)
+
+        try:
+            monoMass = float(monoMass)
+        except (TypeError, ValueError):
+            raise PacMassInputError("Argument 'monoMass' should be a single float")
+
+        monoMass = preprocess.filterMonoMass(monoMass, 0, 4000)[0]
+        return self._predictMass(monoMass, _toNumSList(numSList), ppm, alpha)
+
+    def predict_many(self, monoMassInput, numSList, ppm=10, alpha=0.05, columns=["m/z", "Charge"]):
+        '''predict the elemental compositions of several masses on a thread pool
+
+        Parameters
+        ----------
+
+        monoMassInput: float, list or string
+            A single monoisotopic mass, list of monoisotopic masses, file containing monoisotopic masses
+        numSList: list
+            The number of sulphur-atoms
+        ppm: float
+            mass tolerance
+        alpha: float
+            significance level of the prediction intervals. Currently only 0.05 and 0.01 are allowed
+        columns: list
+            mass and charge columns of the input file
+
+
+        Returns
+        -------
+
+        results: list of numpy.ndarray's
+            Elemental compositions predicted with pacMASS, in the order of the input masses (see pacmass for the columns)
+
+        Raises
+        ------
+
+        PacMassInputError
+            If one of the input parameters is invalid or none of the masses is within the allowed mass boundaries
+        '''
+
+        _checkAlpha(alpha)
+        numSList = _toNumSList(numSList)
+
+        monoMass = preprocess.handleInput(monoMassInput, columns)
+        if len(monoMass) == 0:
+            raise PacMassInputError("The specified masses are not within the allowed mass boundaries.")
+
+        if len(monoMass) == 1:
+            return self._predictMass(monoMass[0], numSList, ppm, alpha)
+
+        totalResults = []
+        for n, future in zip(monoMass, self._submit(monoMass, numSList, ppm, alpha)):
+            # run the masses no worker has picked up yet in this thread
+            if future.cancel():
+                totalResults.extend(self._predictMass(n, numSList, ppm, alpha))
+            else:
+                totalResults.extend(future.result())
+
+        return totalResults
@@ -1,36 +1,24 @@
 #!/usr/bin/env python3
 
-import pandas as pd
 import os
 import sys
+import threading
 
 sys.path.append("..")
-from pacMASS import preprocess
-from pacMASS import calculateAC
 from pacMASS import writeOutputFile
+from pacMASS.engine import PacMass, PacMassInputError
 
 ###############################################################################
 
-def init():
-    _read_AC()
-    _read_ReRa()
+_engine = None
+_engineLock = threading.Lock()
 
-def _read_AC():
-    global _AC
-    #_AC = pd.read_csv("./data/AC_matrix_2.txt", sep="\t").values
-    _AC = pd.read_csv(os.path.join(os.path.dirname(__file__),".\\data\\AC_matrix_2.txt"), sep="\t").values
-                      
-def getAC():
-    global _AC
-    return _AC
-
-def _read_ReRa():
-    global _ReRa
-    #_ReRa = pd.read_csv("./data/RelRatio_matrix.txt", sep="\t").values
-    _ReRa = pd.read_csv(os.path.join(os.path.dirname(__file__),".\\data\\RelRatio_matrix.txt"), sep="\t").values
-def getReRa():
-    global _ReRa
-    return _ReRa
+def getEngine():
+    global _engine
+    with _engineLock:
+        if _engine is None:
+            _engine = PacMass()
+    return _engine
 
 
 def pacmass (monoMassInput, numSList, filename='', ppm=10, alpha=0.05, columns=["m/z", "Charge"]):
@@ -62,38 +50,23 @@ def pacmass (monoMassInput, numSList, filename='', ppm=10, alpha=0.05, columns=[
         Column 6: monoMassInput        
     '''
 
-    init()
-       
-    # Importing atom composition file
-    ac = getAC()
-    # Importing relative isotope intensities
-    RR = getReRa()
+    engine = getEngine()
 
-    if isinstance(numSList, int):
-        numSList = list(map(int, str(numSList)))
+    # the engine rejects other values, pacmass keeps falling back to 0.05 as before
+    if alpha not in (0.05, 0.01):
+        print("alpha = {} cannot be used, set alpha to 0.05".format(alpha))
+        alpha = 0.05
+
+    if isinstance(monoMassInput, str) and os.path.isfile(monoMassInput):
+        print("importing mass input file...")
+        print("calculating monoisotopic mass...")
+
+    print("predicting elemental compositions...")
+    try:
+        totalResults = engine.predict_many(monoMassInput, numSList, ppm, alpha, columns)
+    except PacMassInputError as e:
+        sys.exit("Error: {}".format(e))
 
-    monoMass = preprocess.handleInput(monoMassInput, columns)
-    if monoMass is None:
-        sys.exit("Error: There is a problem with one of your input parameters.")
-        return
-    elif len(monoMass)==0:
-        sys.exit("Error: The specified masses are not within the allowed mass boundaries.")
-        return
-    
-    totalResults = []
-    print("predicting elemental compositions...")    
-    for n in monoMass:
-        results = []
-            
-        for nS in numSList:
-            result = calculateAC.calculateAC(n, RR, ac, nS, ppm, alpha)
-                
-            if result.size !=0:
-                results.append(result)
-            
-        if len(results) != 0:
-            totalResults.extend(results)
-         
     if(len(filename)!=0):
         writeOutputFile.writeOutputFile(totalResults, filename)
         print("Results are written to file")
@@ -6,7 +6,11 @@
 import pandas as pd
 import numpy as np
 import os
-import sys
+
+class PacMassInputError(ValueError):
+    """
+    Exception raised when one of the input parameters of pacMASS is invalid
+    """
 
 def calculateMonoMass(inputDF, columns):
     """
@@ -47,7 +51,7 @@ def filterMonoMass(monoMass, lowerLimit, upperLimit):
         if((monoMass >= lowerLimit) & (monoMass <= upperLimit)):
             return([monoMass])
         else:
-            sys.exit("The specified monoisotopic mass is not within the allowed mass boundaries")
+            raise PacMassInputError("The specified monoisotopic mass is not within the allowed mass boundaries")
             
     elif isinstance(monoMass, np.ndarray):
         if monoMass.dtype=='float64':
@@ -60,7 +64,7 @@ def filterMonoMass(monoMass, lowerLimit, upperLimit):
 
             return monoMassFiltered
         else:
-            sys.exit("The specified monoisotopic masses are not defined as float")
+            raise PacMassInputError("The specified monoisotopic masses are not defined as float")
 def handleInput(monoMassInput, columns):
     """
     Parameters
@@ -75,19 +79,23 @@ def handleInput(monoMassInput, columns):
         monoMassOut: list
             Neutral monoisotopic mass(es)
 
+    Raises
+    ------
+
+        PacMassInputError
+            If one of the input parameters is invalid
+
     """
     
     if not isinstance(monoMassInput, str) and not isinstance(monoMassInput, float) and not isinstance(monoMassInput, list):
-        sys.exit("Argument 'monoMassInput' should be a list, float or a string")
+        raise PacMassInputError("Argument 'monoMassInput' should be a list, float or a string")
   
     if not isinstance(columns, list) or not len(columns)==2:
-        sys.exit("Argument 'columns' should be a list of length 2")
+        raise PacMassInputError("Argument 'columns' should be a list of length 2")
 
     
     if isinstance(monoMassInput, str):
         if os.path.isfile(monoMassInput):
-            print("importing mass input file...")
-
             if monoMassInput.endswith(".txt"):
  
                     mz = pd.read_csv(monoMassInput, delimiter="\t")
@@ -97,10 +105,11 @@ def handleInput(monoMassInput, columns):
                     mz = pd.read_csv(monoMassInput, delimiter=",")
          
             else: 
-                sys.exit("Error: File can not be opened : \"{}\"".format(monoMassInput))
-            
-            
-        print("calculating monoisotopic mass...")
+                raise PacMassInputError("File can not be opened : \"{}\"".format(monoMassInput))
+
+        else:
+            raise PacMassInputError("File does not exist : \"{}\"".format(monoMassInput))
+
         monoMassOut = calculateMonoMass(mz, columns)
 
     if isinstance(monoMassInput, float):
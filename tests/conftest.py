@@ -0,0 +1,14 @@
+import importlib.util
+import os
+import sys
+
+# the modules import each other as "pacMASS", which only works when the checkout directory has that name,
+# so register the repository root under that name for the tests
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+if "pacMASS" not in sys.modules:
+    spec = importlib.util.spec_from_file_location("pacMASS", os.path.join(_ROOT, "__init__.py"),
+                                                  submodule_search_locations=[_ROOT])
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["pacMASS"] = module
+    spec.loader.exec_module(module)
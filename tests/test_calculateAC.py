@@ -0,0 +1,18 @@
+import unittest
+
+from pacMASS import calculateAC
+from test_engine import AC, RR, MASSES
+
+###############################################################################
+
+class TestCalculateAC(unittest.TestCase):
+
+    def test_finds_reference_composition(self):
+        # the element ranges of these compositions have different lengths
+        for ac, mass in zip(AC[:4], MASSES[:4]):
+            results = calculateAC.calculateAC(mass, RR, AC, ac[4])
+            self.assertTrue(any((row[0:5] == ac).all() for row in results))
+
+
+if __name__ == "__main__":
+    unittest.main()
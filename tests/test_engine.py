@@ -0,0 +1,132 @@
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from pacMASS import calculateAC
+from pacMASS.engine import PacMass, PacMassInputError
+
+###############################################################################
+
+WEIGHT = np.array([12, 1.0078250321, 14.0030740052, 15.9949146, 31.97207070])   # weight [C, H, N, O, S]
+
+AC = np.array([
+    [45, 72, 12, 15, 0],
+    [46, 70, 14, 13, 0],
+    [47, 75, 11, 14, 0],
+    [44, 69, 13, 15, 1],
+    [45, 73, 12, 13, 1],
+    [52, 81, 15, 16, 1],
+])
+
+MASSES = list(AC.dot(WEIGHT))
+
+# relative ratios on the fitted isotope ratio curve, so every composition passes the ratio filter
+RR = np.array([calculateAC.calculateIsoRatio(ac[4], mass, 0.05)[:,0] for ac, mass in zip(AC, MASSES)])
+
+NUMS = [0, 1]
+
+
+def serialPredict(masses, ppm=10, alpha=0.05):
+    results = []
+    for n in masses:
+        for nS in NUMS:
+            result = calculateAC.calculateAC(n, RR, AC, nS, ppm, alpha)
+            if result.size != 0:
+                results.append(result)
+    return results
+
+
+class TestPacMass(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = PacMass(ac=AC, RR=RR, maxWorkers=4)
+        self.expected = serialPredict(MASSES)
+
+    def tearDown(self):
+        self.engine.close()
+
+    def assertSameResults(self, results, expected):
+        self.assertEqual(len(results), len(expected))
+        for result, exp in zip(results, expected):
+            np.testing.assert_array_equal(result, exp)
+
+    def test_predict_many_matches_serial(self):
+        self.assertTrue(len(self.expected) > 0)
+        self.assertSameResults(self.engine.predict_many(MASSES, NUMS), self.expected)
+
+    def test_predict_matches_serial(self):
+        for n in MASSES:
+            self.assertSameResults(self.engine.predict(n, NUMS), serialPredict([n]))
+
+    def test_concurrent_calls(self):
+        def run(i):
+            if i % 2 == 0:
+                return self.engine.predict_many(MASSES, NUMS)
+            return [result for n in MASSES for result in self.engine.predict(n, NUMS)]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            allResults = list(executor.map(run, range(32)))
+
+        for results in allResults:
+            self.assertSameResults(results, self.expected)
+
+    def test_external_executor(self):
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            with PacMass(ac=AC, RR=RR, executor=executor) as engine:
+                results = engine.predict_many(MASSES, NUMS)
+            # the engine does not shut down an executor it does not own
+            executor.submit(int).result()
+        self.assertSameResults(results, self.expected)
+
+    def test_close_then_reuse(self):
+        self.assertSameResults(self.engine.predict_many(MASSES, NUMS), self.expected)
+        self.engine.close()
+        self.assertSameResults(self.engine.predict_many(MASSES, NUMS), self.expected)
+
+    def test_close_during_predict_many(self):
+        stop = threading.Event()
+
+        def closeLoop():
+            while not stop.is_set():
+                self.engine.close()
+
+        def run(i):
+            return [self.engine.predict_many(MASSES, NUMS) for _ in range(50)]
+
+        closer = threading.Thread(target=closeLoop)
+        closer.start()
+        try:
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                allResults = [results for batch in executor.map(run, range(4)) for results in batch]
+        finally:
+            stop.set()
+            closer.join()
+
+        for results in allResults:
+            self.assertSameResults(results, self.expected)
+
+    def test_predict_many_from_executor_worker(self):
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            with PacMass(ac=AC, RR=RR, executor=executor) as engine:
+                results = executor.submit(engine.predict_many, MASSES, NUMS).result(timeout=30)
+        self.assertSameResults(results, self.expected)
+
+    def test_invalid_input_raises(self):
+        with self.assertRaises(PacMassInputError):
+            self.engine.predict(5000.0, NUMS)
+        with self.assertRaises(PacMassInputError):
+            self.engine.predict([1000.0, 1200.0], NUMS)
+        with self.assertRaises(PacMassInputError):
+            self.engine.predict(1000.0, NUMS, alpha=0.1)
+        with self.assertRaises(PacMassInputError):
+            self.engine.predict_many([5000.0], NUMS)
+        with self.assertRaises(PacMassInputError):
+            self.engine.predict_many(MASSES, NUMS, columns=["m/z"])
+        with self.assertRaises(PacMassInputError):
+            self.engine.predict_many("does_not_exist.txt", NUMS)
+
+
+if __name__ == "__main__":
+    unittest.main()
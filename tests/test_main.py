@@ -0,0 +1,66 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from pacMASS import main
+from pacMASS.engine import PacMass
+from test_engine import AC, RR, MASSES, NUMS, serialPredict
+
+###############################################################################
+
+class TestPacmass(unittest.TestCase):
+
+    def setUp(self):
+        self.savedEngine = main._engine
+        main._engine = PacMass(ac=AC, RR=RR, maxWorkers=2)
+
+    def tearDown(self):
+        main._engine.close()
+        main._engine = self.savedEngine
+
+    def assertSameResults(self, results, expected):
+        self.assertEqual(len(results), len(expected))
+        for result, exp in zip(results, expected):
+            np.testing.assert_array_equal(result, exp)
+
+    def test_returns_engine_results(self):
+        self.assertSameResults(main.pacmass(MASSES, NUMS), serialPredict(MASSES))
+
+    def test_ppm_and_alpha_are_passed(self):
+        shifted = [n * (1 + 5e-6) for n in MASSES]
+
+        wide = main.pacmass(shifted, NUMS, '', 10, 0.01)
+        narrow = main.pacmass(shifted, NUMS, '', 2, 0.01)
+
+        self.assertSameResults(wide, serialPredict(shifted, 10, 0.01))
+        self.assertSameResults(narrow, serialPredict(shifted, 2, 0.01))
+        self.assertNotEqual(len(wide), len(narrow))
+
+    def test_invalid_alpha_falls_back(self):
+        self.assertSameResults(main.pacmass(MASSES, NUMS, alpha=0.1), serialPredict(MASSES))
+
+    def test_columns_are_passed(self):
+        charge = np.array([1, 2, 3, 1, 2, 3])
+        mz = (np.array(MASSES) + 1.0079 * charge) / charge
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "masses.csv")
+            pd.DataFrame({"mz": mz, "z": charge}).to_csv(path, index=False)
+            results = main.pacmass(path, NUMS, columns=["mz", "z"])
+            masses = pd.read_csv(path)
+
+        self.assertTrue(len(results) > 0)
+        self.assertSameResults(results, serialPredict(list(masses["mz"] * masses["z"] - 1.0079 * masses["z"])))
+
+    def test_invalid_input_exits(self):
+        with self.assertRaises(SystemExit):
+            main.pacmass(5000.0, NUMS)
+        with self.assertRaises(SystemExit):
+            main.pacmass("does_not_exist.txt", NUMS)
+
+
+if __name__ == "__main__":
+    unittest.main()